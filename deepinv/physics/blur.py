@@ -1,8 +1,9 @@
+from collections import OrderedDict
+import weakref
 from torchvision.transforms.functional import rotate
 import torchvision
 import torch.nn.functional as F
 import torch
-import numpy as np
 import torch.fft as fft
 from deepinv.physics.forward import Physics, LinearPhysics, DecomposablePhysics
 from deepinv.utils import TensorList
@@ -12,74 +13,168 @@ def filter_fft(filter, img_size, real_fft=True):
     ph = int((filter.shape[2] - 1) / 2)
     pw = int((filter.shape[3] - 1) / 2)
 
-    filt2 = torch.zeros(filter.shape[:2] + img_size[-2:], device=filter.device)
+    filt2 = torch.zeros(
+        filter.shape[:2] + img_size[-2:], device=filter.device, dtype=filter.dtype
+    )
 
-    filt2[:, : filter.shape[1], : filter.shape[2], : filter.shape[3]] = filter
-    filt2 = torch.roll(filt2, shifts=(-ph, -pw), dims=(2, 3))
+    # write the filter directly at its circularly shifted position instead of rolling the zero-padded image
+    rows = (torch.arange(filter.shape[2], device=filter.device) - ph) % img_size[-2]
+    cols = (torch.arange(filter.shape[3], device=filter.device) - pw) % img_size[-1]
+    filt2[:, :, rows[:, None], cols[None, :]] = filter
 
     return fft.rfft2(filt2) if real_fft else fft.fft2(filt2)
 
 
-def gaussian_blur(sigma=(1, 1), angle=0):
+_FILTER_FFT_CACHE = OrderedDict()
+_FILTER_FFT_CACHE_SIZE = 32
+
+
+def _filter_key(filter):
+    r"""
+    Hashable key identifying the content of a filter tensor, as long as the tensor is alive and not modified.
+    """
+    return (
+        filter.data_ptr(),
+        filter._version,
+        tuple(filter.shape),
+        filter.stride(),
+        filter.dtype,
+        str(filter.device),
+    )
+
+
+def _cached_filter_fft(key, filter, compute, track_filter=True):
+    r"""
+    Least recently used cache of the spectral quantities ``compute(filter)`` of a filter.
+
+    It avoids recomputing the FFT of the filter when an operator is built many times with the same filter, e.g.,
+    once per batch. The cache does not keep the filter alive: entries whose key is derived from the filter tensor
+    (see :meth:`_filter_key`) are removed when it is garbage collected. Every call returns a copy of the cached tensors, such that operators built from the
+    same filter can be modified independently. Filters requiring gradients are never cached.
+
+    :param tuple key: hashable key identifying the filter, the image size and the device.
+    :param torch.Tensor filter: filter from which the spectral quantities are computed.
+    :param callable compute: function computing the tuple of spectral quantities from the filter.
+    :param bool track_filter: whether the key is derived from the filter tensor. Entries with a key that only depends
+        on values (e.g. the name of a filter) are shared by all the operators, and are only removed by the least
+        recently used policy.
+    """
+    if filter.requires_grad or _FILTER_FFT_CACHE_SIZE == 0:
+        return compute(filter)
+
+    if key in _FILTER_FFT_CACHE:
+        _FILTER_FFT_CACHE.move_to_end(key)
+    else:
+        _FILTER_FFT_CACHE[key] = compute(filter)
+        if track_filter:
+            weakref.finalize(filter, _FILTER_FFT_CACHE.pop, key, None)
+        while len(_FILTER_FFT_CACHE) > _FILTER_FFT_CACHE_SIZE:
+            _FILTER_FFT_CACHE.popitem(last=False)
+    return tuple(t.clone() for t in _FILTER_FFT_CACHE[key])
+
+
+def clear_filter_fft_cache():
+    r"""
+    Empties the cache of filter spectra shared by :class:`deepinv.physics.BlurFFT` and
+    :class:`deepinv.physics.Downsampling`.
+    """
+    _FILTER_FFT_CACHE.clear()
+
+
+def set_filter_fft_cache_size(size):
+    r"""
+    Sets the maximum number of filter spectra kept in the cache of :class:`deepinv.physics.BlurFFT` and
+    :class:`deepinv.physics.Downsampling`.
+
+    :param int size: maximum number of cached entries. If ``size=0``, the cache is disabled.
+    """
+    global _FILTER_FFT_CACHE_SIZE
+    _FILTER_FFT_CACHE_SIZE = size
+    while len(_FILTER_FFT_CACHE) > size:
+        _FILTER_FFT_CACHE.popitem(last=False)
+
+
+def gaussian_blur(sigma=(1, 1), angle=0, device="cpu", dtype=torch.float):
     r"""
     Gaussian blur filter.
 
     :param float, tuple[float] sigma: standard deviation of the gaussian filter. If sigma is a float the filter is isotropic, whereas
         if sigma is a tuple of floats (sigma_x, sigma_y) the filter is anisotropic.
     :param float angle: rotation angle of the filter in degrees (only useful for anisotropic filters)
+    :param str device: device where the filter is built.
+    :param torch.dtype dtype: data type of the filter.
     """
     if isinstance(sigma, (int, float)):
         sigma = (sigma, sigma)
 
     s = max(sigma)
     c = int(s / 0.3 + 1)
-    k_size = 2 * c + 1
 
-    delta = torch.arange(k_size)
+    delta = torch.arange(-c, c + 1, device=device, dtype=dtype)
+    gx = (delta / sigma[0]).square_().mul_(-0.5).exp_()
+    gy = (delta / sigma[1]).square_().mul_(-0.5).exp_()
 
-    x, y = torch.meshgrid(delta, delta, indexing="ij")
-    x = x - c
-    y = y - c
-    filt = (x / sigma[0]).pow(2)
-    filt += (y / sigma[1]).pow(2)
-    filt = torch.exp(-filt / 2.0)
+    if angle == 0:
+        # the axis-aligned gaussian is separable: normalizing the 1D factors normalizes their outer product
+        return torch.outer(gx / gx.sum(), gy / gy.sum()).unsqueeze(0).unsqueeze(0)
 
     filt = (
         rotate(
-            filt.unsqueeze(0).unsqueeze(0),
+            torch.outer(gx, gy).unsqueeze(0).unsqueeze(0),
             angle,
             interpolation=torchvision.transforms.InterpolationMode.BILINEAR,
         )
         .squeeze(0)
         .squeeze(0)
     )
-
-    filt = filt / filt.flatten().sum()
+    filt /= filt.sum()
 
     return filt.unsqueeze(0).unsqueeze(0)
 
 
-def bilinear_filter(factor=2):
-    x = np.arange(start=-factor + 0.5, stop=factor, step=1) / factor
-    w = 1 - np.abs(x)
-    w = np.outer(w, w)
-    w = w / np.sum(w)
-    return torch.Tensor(w).unsqueeze(0).unsqueeze(0)
+def bilinear_filter(factor=2, device="cpu", dtype=torch.float):
+    r"""
+    Bilinear filter.
+
+    :param int factor: downsampling factor.
+    :param str device: device where the filter is built.
+    :param torch.dtype dtype: data type of the filter.
+    """
+    x = torch.arange(-factor + 0.5, factor, device=device, dtype=dtype) / factor
+    w = 1 - x.abs()
+    w = torch.outer(w, w) / w.sum() ** 2
+    return w.unsqueeze(0).unsqueeze(0)
 
 
-def bicubic_filter(factor=2):
-    x = np.arange(start=-2 * factor + 0.5, stop=2 * factor, step=1) / factor
+def bicubic_filter(factor=2, device="cpu", dtype=torch.float):
+    r"""
+    Bicubic filter.
+
+    :param int factor: downsampling factor.
+    :param str device: device where the filter is built.
+    :param torch.dtype dtype: data type of the filter.
+    """
+    x = torch.arange(-2 * factor + 0.5, 2 * factor, device=device, dtype=dtype) / factor
     a = -0.5
-    x = np.abs(x)
-    w = ((a + 2) * np.power(x, 3) - (a + 3) * np.power(x, 2) + 1) * (x <= 1)
-    w += (
-        (a * np.power(x, 3) - 5 * a * np.power(x, 2) + 8 * a * x - 4 * a)
-        * (x > 1)
-        * (x < 2)
+    x = x.abs()
+    x2 = x * x
+    x3 = x2 * x
+    w = torch.where(
+        x <= 1,
+        (a + 2) * x3 - (a + 3) * x2 + 1,
+        torch.where(x < 2, a * x3 - 5 * a * x2 + 8 * a * x - 4 * a, 0.0),
     )
-    w = np.outer(w, w)
-    w = w / np.sum(w)
-    return torch.Tensor(w).unsqueeze(0).unsqueeze(0)
+    w = torch.outer(w, w) / w.sum() ** 2
+    return w.unsqueeze(0).unsqueeze(0)
+
+
+_DOWNSAMPLING_FILTERS = {
+    "gaussian": lambda factor, **kwargs: gaussian_blur(
+        sigma=(factor, factor), **kwargs
+    ),
+    "bilinear": bilinear_filter,
+    "bicubic": bicubic_filter,
+}
 
 
 class Downsampling(LinearPhysics):
@@ -101,6 +196,8 @@ class Downsampling(LinearPhysics):
     :param str padding: options are ``'valid'``, ``'circular'``, ``'replicate'`` and ``'reflect'``.
         If ``padding='valid'`` the blurred output is smaller than the image (no padding)
         otherwise the blurred output has the same size as the image.
+    :param torch.memory_format memory_format: memory format used for the convolutions on CUDA devices, e.g.,
+        ``torch.channels_last``. If ``None``, the memory format of the input is kept.
 
     |sep|
 
@@ -126,6 +223,7 @@ class Downsampling(LinearPhysics):
         filter="gaussian",
         device="cpu",
         padding="circular",
+        memory_format=None,
         **kwargs,
     ):
         super().__init__(**kwargs)
@@ -133,40 +231,49 @@ class Downsampling(LinearPhysics):
         assert isinstance(factor, int), "downsampling factor should be an integer"
         self.imsize = img_size
         self.padding = padding
+        self.memory_format = memory_format
         if isinstance(filter, torch.Tensor):
             self.filter = filter.to(device)
         elif filter is None:
             self.filter = filter
-        elif filter == "gaussian":
-            self.filter = (
-                gaussian_blur(sigma=(factor, factor)).requires_grad_(False).to(device)
-            )
-        elif filter == "bilinear":
-            self.filter = bilinear_filter(self.factor).requires_grad_(False).to(device)
-        elif filter == "bicubic":
-            self.filter = bicubic_filter(self.factor).requires_grad_(False).to(device)
+        elif filter in _DOWNSAMPLING_FILTERS:
+            self.filter = _DOWNSAMPLING_FILTERS[filter](factor, device=device)
         else:
             raise Exception("The chosen downsampling filter doesn't exist")
 
         if self.filter is not None:
-            self.Fh = filter_fft(self.filter, img_size, real_fft=False).to(device)
-            self.Fhc = torch.conj(self.Fh)
-            self.Fh2 = self.Fhc * self.Fh
+
+            def compute_fft(filt):
+                Fh = filter_fft(filt, img_size).to(device)
+                return Fh, torch.conj(Fh)
+
+            if isinstance(filter, str):
+                key = filter
+            else:
+                key = _filter_key(self.filter)
+            key = ("downsampling", key, factor, tuple(img_size[-2:]), str(device))
             self.filter = torch.nn.Parameter(self.filter, requires_grad=False)
+            self.Fh, self.Fhc = _cached_filter_fft(
+                key, self.filter, compute_fft, track_filter=not isinstance(filter, str)
+            )
             self.Fhc = torch.nn.Parameter(self.Fhc, requires_grad=False)
-            self.Fh2 = torch.nn.Parameter(self.Fh2, requires_grad=False)
+        self._Fh2_mean = None
 
     def A(self, x):
         if self.filter is not None:
-            x = conv(x, self.filter, padding=self.padding)
+            x = conv(
+                x, self.filter, padding=self.padding, memory_format=self.memory_format
+            )
         x = x[:, :, :: self.factor, :: self.factor]  # downsample
         return x
 
     def A_adjoint(self, y):
-        x = torch.zeros((y.shape[0],) + self.imsize, device=y.device)
+        x = torch.zeros((y.shape[0],) + self.imsize, device=y.device, dtype=y.dtype)
         x[:, :, :: self.factor, :: self.factor] = y  # upsample
         if self.filter is not None:
-            x = conv_transpose(x, self.filter, padding=self.padding)
+            x = conv_transpose(
+                x, self.filter, padding=self.padding, memory_format=self.memory_format
+            )
         return x
 
     def prox_l2(self, z, y, gamma, use_fft=True):
@@ -179,29 +286,43 @@ class Downsampling(LinearPhysics):
 
         if use_fft and self.padding == "circular":  # Formula from (Zhao, 2016)
             z_hat = self.A_adjoint(y) + 1 / gamma * z
-            Fz_hat = fft.fft2(z_hat)
-
-            def splits(a, sf):
-                """split a into sfxsf distinct blocks
-                Args:
-                    a: NxCxWxH
-                    sf: split factor
-                Returns:
-                    b: NxCx(W/sf)x(H/sf)x(sf^2)
-                """
-                b = torch.stack(torch.chunk(a, sf, dim=2), dim=4)
-                b = torch.cat(torch.chunk(b, sf, dim=3), dim=4)
-                return b
-
-            top = torch.mean(splits(self.Fh * Fz_hat, self.factor), dim=-1)
-            below = torch.mean(splits(self.Fh2, self.factor), dim=-1) + 1 / gamma
-            rc = self.Fhc * (top / below).repeat(1, 1, self.factor, self.factor)
-            r = torch.real(fft.ifft2(rc))
+            Fz_hat = fft.rfft2(z_hat)
+
+            top = _splits_mean(self.Fh * Fz_hat, self.factor, z_hat.shape[-2:])
+            if self._Fh2_mean is None:
+                # the denominator only depends on gamma through an additive constant: the average of the aliases
+                # of |Fh|^2, which is real as |Fh|^2 is real and non-negative, is computed once
+                Fh2 = self.Fh.real.square() + self.Fh.imag.square()
+                Fh2_mean = _splits_mean(Fh2, self.factor, z_hat.shape[-2:])
+                self._Fh2_mean = Fh2_mean.real.contiguous()
+            below = self._Fh2_mean + 1 / gamma
+            # the ratio is periodic in frequency: tile it along the columns only, and broadcast it
+            # over the sf row blocks of Fhc instead of materializing the full repeated spectrum
+            rc = (top / below).repeat(1, 1, 1, self.factor)[..., : self.Fhc.shape[-1]]
+            Fhc = self.Fhc.view(
+                *self.Fhc.shape[:-2], self.factor, -1, self.Fhc.shape[-1]
+            )
+            rc = (Fhc * rc.unsqueeze(-3)).flatten(-3, -2)
+            r = fft.irfft2(rc, s=z_hat.shape[-2:])
             return (z_hat - r) * gamma
         else:
             return LinearPhysics.prox_l2(self, z, y, gamma)
 
 
+def _splits_mean(a, sf, img_size):
+    """average the sfxsf spectral aliases of a real signal given by its rfft, which amounts
+    to computing the fft of the signal decimated by sf
+    Args:
+        a: NxCxWx(H/2+1)
+        sf: split factor
+        img_size: (W, H) size of the signal
+    Returns:
+        b: NxCx(W/sf)x(H/sf)
+    """
+    a = fft.irfft2(a, s=img_size)
+    return fft.fft2(a[..., ::sf, ::sf])
+
+
 def extend_filter(filter):
     b, c, h, w = filter.shape
     w_new = w
@@ -222,21 +343,27 @@ def extend_filter(filter):
     elif h % 2 == 0:
         h_new += 1
 
-    out = torch.zeros((b, c, h_new, w_new), device=filter.device)
+    out = torch.zeros((b, c, h_new, w_new), device=filter.device, dtype=filter.dtype)
     out[:, :, offset_h : h + offset_h, offset_w : w + offset_w] = filter
     return out
 
 
-def conv(x, filter, padding):
+def conv(x, filter, padding, memory_format=None, stacked=False):
     r"""
     Convolution of x and filter. The transposed of this operation is conv_transpose(x, filter, padding)
 
     :param x: (torch.Tensor) Image of size (B,C,W,H).
-    :param filter: (torcstring)h.Tensor) Filter of size (1,C,W,H) for colour filtering or (1,1,W,H) for filtering each channel with the same filter.
+    :param filter: (torch.Tensor) Filter of size (b,c,W,H) with b equal to 1 or B, which is shared across the batch
+        if b=1. A filter of size (b,1,W,H) filters each channel with the same filter, whereas a filter of size
+        (b,C,W,H) is a colour filter, which sums the filtered channels into a single channel output.
     :param padding: ( options = 'valid', 'circular', 'replicate', 'reflect'. If padding='valid' the blurred output is smaller than the image (no padding), otherwise the blurred output has the same size as the image.
+    :param torch.memory_format memory_format: memory format used for the convolution on CUDA devices, e.g.,
+        ``torch.channels_last``. If ``None``, the memory format of the input is kept.
+    :param bool stacked: if ``True``, the filter of size (K,1,W,H) is a stack of K filters shared across the batch,
+        and each channel is filtered with each of them, resulting in an output with C*K channels ordered by channel.
 
     """
-    b, c, h, w = x.shape
+    B, C = x.shape[:2]
 
     filter = filter.flip(-1).flip(
         -2
@@ -252,28 +379,40 @@ def conv(x, filter, padding):
         ph = int(ph)
         x = F.pad(x, (pw, pw, ph, ph), mode=padding, value=0)
 
-    if filter.shape[1] == 1:
-        if filter.shape[0] == 1:
-            filter = filter.repeat(c, 1, 1, 1)
-        y = F.conv2d(x, filter, padding="valid", groups=c)
+    if stacked:
+        assert filter.shape[1] == 1, "a stack of filters should have a single channel"
+        # filter each channel with all the filters in a single convolution
+        x = x.reshape(B * C, 1, x.shape[-2], x.shape[-1])
+        groups = 1
     else:
-        y = F.conv2d(x, filter, padding="valid")
+        x, filter, groups = _grouped(x, filter)
+    x, filter = _to_memory_format(x, filter, memory_format)
+    y = F.conv2d(x, filter, padding="valid", groups=groups)
 
-    return y
+    return y.reshape(B, -1, y.shape[-2], y.shape[-1])
 
 
-def conv_transpose(y, filter, padding):
+def conv_transpose(y, filter, padding, memory_format=None, stacked=False):
     r"""
     Transposed convolution of x and filter. The transposed of this operation is conv(x, filter, padding)
 
     :param torch.Tensor x: Image of size (B,C,W,H).
-    :param torch.Tensor filter: Filter of size (1,C,W,H) for colour filtering or (1,C,W,H) for filtering each channel with the same filter.
+    :param torch.Tensor filter: Filter of size (b,c,W,H) with b equal to 1 or B (see :meth:`conv`). For a colour
+        filter with c>1 channels, x has a single channel and the output has c channels.
     :param str padding: options are ``'valid'``, ``'circular'``, ``'replicate'`` and ``'reflect'``.
         If ``padding='valid'`` the blurred output is smaller than the image (no padding)
         otherwise the blurred output has the same size as the image.
+    :param torch.memory_format memory_format: memory format used for the convolution on CUDA devices, e.g.,
+        ``torch.channels_last``. If ``None``, the memory format of the input is kept.
+    :param bool stacked: if ``True``, the filter of size (K,1,W,H) is a stack of K filters (see :meth:`conv`), x has
+        C*K channels and the output has C channels.
     """
 
-    b, c, h, w = y.shape
+    B, C, h, w = y.shape
+    K = filter.shape[0]
+    if stacked:
+        assert filter.shape[1] == 1, "a stack of filters should have a single channel"
+        C = C // K
 
     filter = filter.flip(-1).flip(
         -2
@@ -281,72 +420,190 @@ def conv_transpose(y, filter, padding):
 
     filter = extend_filter(filter)
 
-    ph = (filter.shape[2] - 1) / 2
-    pw = (filter.shape[3] - 1) / 2
-
-    h_out = int(h + 2 * ph)
-    w_out = int(w + 2 * pw)
-    pw = int(pw)
-    ph = int(ph)
+    ph = int((filter.shape[2] - 1) / 2)
+    pw = int((filter.shape[3] - 1) / 2)
 
-    x = torch.zeros((b, c, h_out, w_out), device=y.device)
-    if filter.shape[1] == 1:
-        for i in range(b):
-            if filter.shape[0] > 1:
-                f = filter[i, :, :, :].unsqueeze(0)
-            else:
-                f = filter
+    if padding == "circular":
+        # the adjoint of a circular convolution is the circular correlation with the flipped filter,
+        # which avoids the transposed convolution and the folding of the borders
+        y = F.pad(y, (pw, pw, ph, ph), mode="circular")
+        filter = filter.flip(-1).flip(-2)
+        if stacked:  # sum the correlations with the K filters
+            y = y.reshape(B * C, K, y.shape[-2], y.shape[-1])
+            filter = filter.transpose(0, 1)
+            groups = 1
+        else:
+            y, filter, groups = _grouped(y, filter, adjoint=True)
+        y, filter = _to_memory_format(y, filter, memory_format)
+        return F.conv2d(y, filter, groups=groups).reshape(B, -1, h, w)
 
-            for j in range(c):
-                x[i, j, :, :] = F.conv_transpose2d(
-                    y[i, j, :, :].unsqueeze(0).unsqueeze(1), f
-                )
+    if stacked:
+        y = y.reshape(B * C, K, h, w)
+        groups = 1
     else:
-        x = F.conv_transpose2d(y, filter)
+        y, filter, groups = _grouped(y, filter)
+    y, filter = _to_memory_format(y, filter, memory_format)
+    x = F.conv_transpose2d(y, filter, groups=groups)
+    x = x.reshape(B, -1, x.shape[-2], x.shape[-1])
+
+    return _fold_padding(x, ph, pw, padding)
+
+
+def _grouped(x, filter, adjoint=False):
+    r"""
+    Prepares the grouped convolution of x of size (B,C,H,W) with a filter of size (b,c,h,w), where b is 1 or B.
+
+    A filter with a single channel filters each channel of x (depthwise convolution with b*C groups), whereas a
+    colour filter with c=C channels sums the filtered channels of x into a single channel (b groups). If b=B, the
+    batch is folded into the channels. The filter is only copied when it has to be broadcast.
 
+    :param bool adjoint: if ``True`` and c>1, returns the weights of the :meth:`torch.nn.functional.conv2d` computing
+        the adjoint of the colour filtering, which maps the single channel x to c channels.
+    :return: the input, the weights and the number of groups of the convolution.
+    """
+    B, C = x.shape[:2]
+    b, c, h, w = filter.shape
+    if b > 1:
+        x = x.reshape(1, B * C, x.shape[-2], x.shape[-1])
+    if c == 1:
+        return x, filter.expand(b, C, h, w).reshape(b * C, 1, h, w), b * C
+    if adjoint:
+        return x, filter.reshape(b * c, 1, h, w), b
+    return x, filter, b
+
+
+def _to_memory_format(x, filter, memory_format):
+    r"""
+    Converts the input and the filter of a convolution to ``memory_format`` on CUDA devices, where
+    ``torch.channels_last`` enables the faster NHWC kernels of cuDNN.
+    """
+    if memory_format is None or not x.is_cuda:
+        return x, filter
+    return x.contiguous(memory_format=memory_format), filter.contiguous(
+        memory_format=memory_format
+    )
+
+
+def _fold_padding(x, ph, pw, padding):
+    r"""
+    Adjoint of the padding applied in :meth:`conv`: folds the borders of the full transposed convolution ``x``
+    back into an image of the original size.
+
+    :param torch.Tensor x: Output of the full transposed convolution of size (B,C,H+2ph,W+2pw).
+    :param int ph: vertical padding size.
+    :param int pw: horizontal padding size.
+    :param str padding: options are ``'valid'``, ``'zero'``, ``'replicate'`` and ``'reflect'``. The circular case is
+        handled directly by :meth:`conv_transpose`.
+    """
     if padding == "valid":
-        out = x
+        return x
     elif padding == "zero":
-        out = x[:, :, ph:-ph, pw:-pw]
-    elif padding == "circular":
-        out = x[:, :, ph:-ph, pw:-pw]
-        # sides
-        out[:, :, :ph, :] += x[:, :, -ph:, pw:-pw]
-        out[:, :, -ph:, :] += x[:, :, :ph, pw:-pw]
-        out[:, :, :, :pw] += x[:, :, ph:-ph, -pw:]
-        out[:, :, :, -pw:] += x[:, :, ph:-ph, :pw]
-        # corners
-        out[:, :, :ph, :pw] += x[:, :, -ph:, -pw:]
-        out[:, :, -ph:, -pw:] += x[:, :, :ph, :pw]
-        out[:, :, :ph, -pw:] += x[:, :, -ph:, :pw]
-        out[:, :, -ph:, :pw] += x[:, :, :ph, -pw:]
-
+        return x[:, :, ph:-ph, pw:-pw]
     elif padding == "reflect":
-        out = x[:, :, ph:-ph, pw:-pw]
-        # sides
-        out[:, :, 1 : 1 + ph, :] += x[:, :, :ph, pw:-pw].flip(dims=(2,))
-        out[:, :, -ph - 1 : -1, :] += x[:, :, -ph:, pw:-pw].flip(dims=(2,))
-        out[:, :, :, 1 : 1 + pw] += x[:, :, ph:-ph, :pw].flip(dims=(3,))
-        out[:, :, :, -pw - 1 : -1] += x[:, :, ph:-ph, -pw:].flip(dims=(3,))
-        # corners
-        out[:, :, 1 : 1 + ph, 1 : 1 + pw] += x[:, :, :ph, :pw].flip(dims=(2, 3))
-        out[:, :, -ph - 1 : -1, -pw - 1 : -1] += x[:, :, -ph:, -pw:].flip(dims=(2, 3))
-        out[:, :, -ph - 1 : -1, 1 : 1 + pw] += x[:, :, -ph:, :pw].flip(dims=(2, 3))
-        out[:, :, 1 : 1 + ph, -pw - 1 : -1] += x[:, :, :ph, -pw:].flip(dims=(2, 3))
-
+        return _fold_reflect(x, ph, pw)
     elif padding == "replicate":
-        out = x[:, :, ph:-ph, pw:-pw]
-        # sides
-        out[:, :, 0, :] += x[:, :, :ph, pw:-pw].sum(2)
-        out[:, :, -1, :] += x[:, :, -ph:, pw:-pw].sum(2)
-        out[:, :, :, 0] += x[:, :, ph:-ph, :pw].sum(3)
-        out[:, :, :, -1] += x[:, :, ph:-ph, -pw:].sum(3)
-        # corners
-        out[:, :, 0, 0] += x[:, :, :ph, :pw].sum(3).sum(2)
-        out[:, :, -1, -1] += x[:, :, -ph:, -pw:].sum(3).sum(2)
-        out[:, :, -1, 0] += x[:, :, -ph:, :pw].sum(3).sum(2)
-        out[:, :, 0, -1] += x[:, :, :ph, -pw:].sum(3).sum(2)
-    return out
+        return _fold_replicate(x, ph, pw)
+
+
+def _fold_reflect(x, ph, pw):
+    r"""
+    Adjoint of the ``'reflect'`` padding, computed with the fused backward kernel of the padding.
+    """
+    return _pad_backward(torch.ops.aten.reflection_pad2d_backward, x, ph, pw)
+
+
+def _fold_replicate(x, ph, pw):
+    r"""
+    Adjoint of the ``'replicate'`` padding, computed with the fused backward kernel of the padding.
+    """
+    return _pad_backward(torch.ops.aten.replication_pad2d_backward, x, ph, pw)
+
+
+def _pad_backward(op, x, ph, pw):
+    r"""
+    Calls the backward kernel ``op`` of a 2D padding of size (pw, pw, ph, ph) on the padded tensor ``x``.
+
+    These are the kernels autograd uses for the backward of :meth:`torch.nn.functional.pad`, and they are
+    differentiable. They are not part of the public API: this relies on their ATen signature
+    ``(Tensor grad_output, Tensor self, SymInt[4] padding)``, where ``self`` is the unpadded input of the padding,
+    only used for its shape, dtype and device. Calling them directly avoids building an autograd graph for the
+    padding.
+    """
+    shape = x.shape[:2] + (x.shape[2] - 2 * ph, x.shape[3] - 2 * pw)
+    return op(x, torch.empty(shape, device=x.device, dtype=x.dtype), [pw, pw, ph, ph])
+
+
+def _separable_factors(filter):
+    r"""
+    Factorizes a single filter of size (1,1,H,W) into two 1D filters.
+
+    The factors ``(col, row)`` are such that ``col[:, None] * row[None, :]`` is the flipped and extended filter used
+    by :meth:`conv` and :meth:`conv_transpose`.
+
+    :param torch.Tensor filter: Filter of size (1,1,H,W).
+    :return: tuple of 1D tensors ``(col, row)`` or ``None`` if the filter is not separable.
+    """
+    if filter.shape[:2] != (1, 1):
+        return None
+
+    k = extend_filter(filter.flip(-1).flip(-2))[0, 0]
+    i, j = divmod(int(torch.argmax(k.abs())), k.shape[1])
+    if k[i, j] == 0:
+        return None
+
+    col = k[:, j]
+    row = k[i, :] / k[i, j]
+    if not torch.allclose(torch.outer(col, row), k, rtol=1e-6, atol=1e-10):
+        return None
+    return col, row
+
+
+def conv_separable(x, col, row, padding):
+    r"""
+    Convolution of x with the separable filter ``col[:, None] * row[None, :]``, computed as two 1D convolutions.
+
+    The factors are the ones returned by :meth:`_separable_factors`, i.e., they are already flipped and extended.
+
+    :param torch.Tensor x: Image of size (B,C,W,H).
+    :param torch.Tensor col: vertical 1D filter of odd size.
+    :param torch.Tensor row: horizontal 1D filter of odd size.
+    :param str padding: options are ``'valid'``, ``'circular'``, ``'replicate'`` and ``'reflect'``.
+    """
+    B, C = x.shape[:2]
+    ph = (col.shape[0] - 1) // 2
+    pw = (row.shape[0] - 1) // 2
+
+    if padding != "valid":
+        x = F.pad(x, (pw, pw, ph, ph), mode=padding, value=0)
+
+    x = x.reshape(B * C, 1, x.shape[-2], x.shape[-1])
+    x = F.conv2d(x, row.view(1, 1, 1, -1))
+    x = F.conv2d(x, col.view(1, 1, -1, 1))
+    return x.view(B, C, x.shape[-2], x.shape[-1])
+
+
+def conv_transpose_separable(y, col, row, padding):
+    r"""
+    Transposed convolution of y with the separable filter ``col[:, None] * row[None, :]``, computed as two 1D
+    transposed convolutions. The transposed of this operation is :meth:`conv_separable`.
+
+    :param torch.Tensor y: Image of size (B,C,W,H).
+    :param torch.Tensor col: vertical 1D filter of odd size.
+    :param torch.Tensor row: horizontal 1D filter of odd size.
+    :param str padding: options are ``'valid'``, ``'circular'``, ``'replicate'`` and ``'reflect'``.
+    """
+    if padding == "circular":
+        return conv_separable(y, col.flip(0), row.flip(0), padding)
+
+    B, C, h, w = y.shape
+    ph = (col.shape[0] - 1) // 2
+    pw = (row.shape[0] - 1) // 2
+
+    x = y.reshape(B * C, 1, h, w)
+    x = F.conv_transpose2d(x, col.view(1, 1, -1, 1))
+    x = F.conv_transpose2d(x, row.view(1, 1, 1, -1))
+    x = x.view(B, C, x.shape[-2], x.shape[-1])
+    return _fold_padding(x, ph, pw, padding)
 
 
 class BlindBlur(Physics):
@@ -404,7 +661,11 @@ class BlindBlur(Physics):
         x = y.clone()
         mid_h = int(self.kernel_size[0] / 2)
         mid_w = int(self.kernel_size[1] / 2)
-        w = torch.zeros((y.shape[0], 1, self.kernel_size[0], self.kernel_size[1]))
+        w = torch.zeros(
+            (y.shape[0], 1, self.kernel_size[0], self.kernel_size[1]),
+            device=y.device,
+            dtype=y.dtype,
+        )
         w[:, :, mid_h, mid_w] = 1.0
 
         return TensorList([x, w])
@@ -424,9 +685,16 @@ class Blur(LinearPhysics):
     This class uses :meth:`torch.nn.functional.conv2d` for performing the convolutions.
 
     :param torch.Tensor filter: Tensor of size (1, 1, H, W) or (1, C, H, W) containing the blur filter, e.g., :meth:`deepinv.physics.blur.gaussian_blur`.
+        A filter of size (1, 1, H, W) blurs each channel with the same filter, whereas a filter of size (1, C, H, W)
+        is a colour filter, which sums the filtered channels into a single channel measurement.
+        If ``stacked=True``, the filter of size (K, 1, H, W) is a stack of K filters.
     :param str padding: options are ``'valid'``, ``'circular'``, ``'replicate'`` and ``'reflect'``. If ``padding='valid'`` the blurred output is smaller than the image (no padding)
         otherwise the blurred output has the same size as the image.
     :param str device: cpu or cuda.
+    :param torch.memory_format memory_format: memory format used for the convolutions on CUDA devices, e.g.,
+        ``torch.channels_last``. If ``None``, the memory format of the input is kept.
+    :param bool stacked: if ``True``, each channel is blurred with each of the K filters of the stack, and the
+        measurements have C*K channels (see :meth:`deepinv.physics.blur.conv`).
 
     |sep|
 
@@ -447,17 +715,51 @@ class Blur(LinearPhysics):
 
     """
 
-    def __init__(self, filter, padding="circular", device="cpu", **kwargs):
+    def __init__(
+        self,
+        filter,
+        padding="circular",
+        device="cpu",
+        memory_format=None,
+        stacked=False,
+        **kwargs,
+    ):
         super().__init__(**kwargs)
         self.padding = padding
         self.device = device
+        self.memory_format = memory_format
+        self.stacked = stacked
         self.filter = torch.nn.Parameter(filter, requires_grad=False).to(device)
+        self._factors = (None, None, None)
+
+    @property
+    def filter_factors(self):
+        r"""
+        1D factors of the filter if it is separable (e.g. an axis-aligned gaussian), which is then applied as two 1D
+        convolutions, or ``None`` otherwise.
+
+        The factors are derived from the current filter, and are recomputed whenever the filter is replaced, modified
+        in place or moved to another device or data type.
+        """
+        filt, key, factors = self._factors
+        if filt is not self.filter or key != _filter_key(self.filter):
+            factors = _separable_factors(self.filter)
+            self._factors = (self.filter, _filter_key(self.filter), factors)
+        return factors
 
     def A(self, x):
-        return conv(x, self.filter, self.padding)
+        factors = self.filter_factors
+        if factors is not None:
+            return conv_separable(x, *factors, self.padding)
+        return conv(x, self.filter, self.padding, self.memory_format, self.stacked)
 
     def A_adjoint(self, y):
-        return conv_transpose(y, self.filter, self.padding)
+        factors = self.filter_factors
+        if factors is not None:
+            return conv_transpose_separable(y, *factors, self.padding)
+        return conv_transpose(
+            y, self.filter, self.padding, self.memory_format, self.stacked
+        )
 
 
 class BlurFFT(DecomposablePhysics):
@@ -478,7 +780,8 @@ class BlurFFT(DecomposablePhysics):
 
     :param tuple img_size: Input image size in the form (C, H, W).
     :param torch.Tensor filter: torch.Tensor of size (1, 1, H, W) or (1, C, H, W) containing the blur filter, e.g.,
-        :meth:`deepinv.physics.blur.gaussian_blur`.
+        :meth:`deepinv.physics.blur.gaussian_blur`. A single channel filter is shared by all the channels, and the
+        singular values are then broadcast along the channel dimension.
     :param str device: cpu or cuda
 
     |sep|
@@ -504,16 +807,19 @@ class BlurFFT(DecomposablePhysics):
         super().__init__(**kwargs)
         self.img_size = img_size
 
-        if img_size[0] > filter.shape[1]:
-            filter = filter.repeat(1, img_size[0], 1, 1)
+        def compute_fft(filt):
+            # a filter shared by all channels keeps a single channel: its spectrum broadcasts over them
+            mask = filter_fft(filt.to(device), img_size)
+            angle = torch.exp(-1j * torch.angle(mask))
+            # the singular values are real: keep a single copy, broadcast over the real and imaginary
+            # parts of the spectrum
+            mask = torch.abs(mask).unsqueeze(-1)
+            return mask, angle
 
-        self.mask = filter_fft(filter, img_size).to("cpu")
-        self.angle = torch.angle(self.mask)
-        self.angle = torch.exp(-1j * self.angle).to(device)
-        self.mask = torch.abs(self.mask).unsqueeze(-1)
-        self.mask = torch.cat([self.mask, self.mask], dim=-1)
+        key = ("blurfft", _filter_key(filter), tuple(img_size), str(device))
+        self.mask, self.angle = _cached_filter_fft(key, filter, compute_fft)
 
-        self.mask = torch.nn.Parameter(self.mask, requires_grad=False).to(device)
+        self.mask = torch.nn.Parameter(self.mask, requires_grad=False)
 
     def V_adjoint(self, x):
         return torch.view_as_real(
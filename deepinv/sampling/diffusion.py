@@ -139,15 +139,16 @@ class DDRM(nn.Module):
             else:
                 sigma_noise = 0.01
 
+            y_bar = physics.U_adjoint(y)
             if physics.__class__ == deepinv.physics.Denoising:
                 mask = torch.ones_like(
                     y
                 )  # TODO: fix for economic SVD decompositions (eg. Decolorize)
             else:
-                mask = torch.cat([physics.mask.abs()] * y.shape[0], dim=0)
+                # the singular values may only be broadcastable to the transformed measurements
+                mask = physics.mask.abs().expand_as(y_bar)
 
             c = np.sqrt(1 - self.eta**2)
-            y_bar = physics.U_adjoint(y)
             case = mask > sigma_noise
             y_bar[case] = y_bar[case] / mask[case]
             nsr = torch.zeros_like(mask)
@@ -437,6 +437,209 @@ def test_blur(device):
     assert error_At < 1e-6
 
 
+@pytest.mark.parametrize("padding", ["valid", "circular", "reflect", "replicate"])
+def test_separable_blur(padding, device):
+    r"""
+    Tests that the separable fast path of the blur operator matches the generic convolution.
+
+    :param padding: (str) padding mode
+    :param device: (torch.device) cpu or cuda:x
+    """
+    torch.manual_seed(0)
+    x = torch.randn((2, 3, 32, 31), device=device)
+    h = dinv.physics.blur.gaussian_blur(sigma=(2.0, 1.0))
+
+    physics = dinv.physics.Blur(filter=h, padding=padding, device=device)
+    assert physics.filter_factors is not None
+
+    y = physics.A(x)
+    y_ref = dinv.physics.blur.conv(x, physics.filter, padding)
+    assert torch.allclose(y, y_ref, atol=1e-6)
+
+    back = physics.A_adjoint(y)
+    back_ref = dinv.physics.blur.conv_transpose(y, physics.filter, padding)
+    assert torch.allclose(back, back_ref, atol=1e-6)
+
+
+def test_separable_blur_update(device):
+    r"""
+    Tests that the separable factors of the blur operator follow the filter when it is modified or converted.
+
+    :param device: (torch.device) cpu or cuda:x
+    """
+    torch.manual_seed(0)
+    x = torch.randn((1, 1, 16, 16), device=device)
+    physics = dinv.physics.Blur(
+        filter=dinv.physics.blur.gaussian_blur(sigma=(2.0, 1.0)), device=device
+    )
+    physics(x)
+
+    h = torch.outer(torch.rand(5, device=device), torch.rand(4, device=device))
+    physics.filter = torch.nn.Parameter(h[None, None], requires_grad=False)
+    y_ref = dinv.physics.blur.conv(x, physics.filter, physics.padding)
+    assert torch.allclose(physics(x), y_ref, atol=1e-6)
+
+    with torch.no_grad():
+        physics.filter.copy_(physics.filter.flip(-1))
+    y_ref = dinv.physics.blur.conv(x, physics.filter, physics.padding)
+    assert torch.allclose(physics(x), y_ref, atol=1e-6)
+
+    physics = physics.double()
+    assert physics(x.double()).dtype == torch.float64
+
+
+@pytest.mark.parametrize(
+    "filter_shape", [(1, 1, 5, 4), (1, 3, 4, 4), (2, 1, 3, 3), (2, 3, 3, 3)]
+)
+def test_conv_transpose_circular(filter_shape, device):
+    r"""
+    Tests that the circular transposed convolution is the adjoint of the circular convolution.
+
+    :param filter_shape: (tuple) size of the filter
+    :param device: (torch.device) cpu or cuda:x
+    """
+    torch.manual_seed(0)
+    x = torch.randn((2, 3, 16, 15), device=device)
+    h = torch.rand(filter_shape, device=device)
+
+    Ax = dinv.physics.blur.conv(x, h, "circular")
+    y = torch.randn_like(Ax)
+    Aty = dinv.physics.blur.conv_transpose(y, h, "circular")
+
+    assert Aty.shape == x.shape
+    assert torch.allclose((Ax * y).sum(), (x * Aty).sum(), rtol=1e-4)
+
+
+@pytest.mark.parametrize("padding", ["valid", "circular", "reflect", "replicate"])
+@pytest.mark.parametrize("batch_size", [2, 4])
+def test_conv_stacked_filters(padding, batch_size, device):
+    r"""
+    Tests the convolution with a stack of filters and its adjoint, including when the batch size equals the number
+    of filters.
+
+    :param padding: (str) padding mode
+    :param batch_size: (int) number of images
+    :param device: (torch.device) cpu or cuda:x
+    """
+    torch.manual_seed(0)
+    x = torch.randn((batch_size, 3, 16, 15), device=device)
+    h = torch.rand((4, 1, 5, 4), device=device)
+
+    Ax = dinv.physics.blur.conv(x, h, padding, stacked=True)
+    assert Ax.shape[:2] == (batch_size, 12)
+    Ax_ref = dinv.physics.blur.conv(x, h[1:2], padding)
+    Ax_1 = Ax.view(batch_size, 3, 4, *Ax.shape[-2:])[:, :, 1]
+    assert torch.allclose(Ax_1, Ax_ref, atol=1e-5)
+
+    y = torch.randn_like(Ax)
+    Aty = dinv.physics.blur.conv_transpose(y, h, padding, stacked=True)
+    assert Aty.shape == x.shape
+    assert torch.allclose((Ax * y).sum(), (x * Aty).sum(), rtol=1e-4)
+
+
+@pytest.mark.parametrize("padding", ["valid", "circular", "reflect", "replicate"])
+def test_blur_adjointness(padding, device):
+    r"""
+    Tests that the blur operator has a well defined adjoint for all padding modes.
+
+    :param padding: (str) padding mode
+    :param device: (torch.device) cpu or cuda:x
+    """
+    torch.manual_seed(0)
+    h = dinv.physics.blur.gaussian_blur(sigma=(2, 0.5), angle=30.0)
+    physics = dinv.physics.Blur(filter=h, padding=padding, device=device)
+    assert physics.filter_factors is None
+
+    x = torch.randn((2, 3, 24, 21), device=device)
+    assert physics.adjointness_test(x).abs() < 1e-3
+
+
+def test_blur_colour_filter(device):
+    r"""
+    Tests that a colour filter sums the channels filtered by its channels, and that its adjoint is well defined.
+
+    :param device: (torch.device) cpu or cuda:x
+    """
+    torch.manual_seed(0)
+    x = torch.randn((2, 3, 32, 32), device=device)
+    h = torch.rand((1, 3, 5, 4), device=device)
+
+    physics = dinv.physics.Blur(filter=h, device=device)
+    y_ref = sum(
+        dinv.physics.blur.conv(x[:, i : i + 1], h[:, i : i + 1], "circular")
+        for i in range(3)
+    )
+    assert torch.allclose(physics(x), y_ref, atol=1e-5)
+    assert physics.adjointness_test(x).abs() < 1e-3
+
+
+def test_filter_fft_cache(device):
+    r"""
+    Tests that operators built from the same filter reuse its cached spectrum without sharing memory.
+
+    :param device: (torch.device) cpu or cuda:x
+    """
+    dinv.physics.blur.clear_filter_fft_cache()
+    h = dinv.physics.blur.gaussian_blur(sigma=(1.0, 2.0))
+    p1 = dinv.physics.BlurFFT(img_size=(1, 16, 16), filter=h, device=device)
+    p2 = dinv.physics.BlurFFT(img_size=(1, 16, 16), filter=h, device=device)
+    assert torch.equal(p1.angle, p2.angle)
+    assert p1.mask.data_ptr() != p2.mask.data_ptr()
+
+    with torch.no_grad():
+        p1.mask *= 2
+    p3 = dinv.physics.BlurFFT(img_size=(1, 16, 16), filter=h, device=device)
+    assert torch.equal(p2.mask, p3.mask)
+
+    p4 = dinv.physics.BlurFFT(img_size=(1, 32, 32), filter=h, device=device)
+    assert p4.angle.shape != p1.angle.shape
+
+    size = len(dinv.physics.blur._FILTER_FFT_CACHE)
+    del h
+    assert len(dinv.physics.blur._FILTER_FFT_CACHE) < size
+
+    # named filters stay cached after the operator that computed them is deleted
+    dinv.physics.blur.clear_filter_fft_cache()
+    d1 = dinv.physics.Downsampling(img_size=(1, 16, 16), device=device)
+    del d1
+    assert len(dinv.physics.blur._FILTER_FFT_CACHE) == 1
+
+    dinv.physics.blur.set_filter_fft_cache_size(0)
+    try:
+        dinv.physics.Downsampling(img_size=(1, 16, 16), device=device)
+        assert len(dinv.physics.blur._FILTER_FFT_CACHE) == 0
+    finally:
+        dinv.physics.blur.set_filter_fft_cache_size(32)
+
+
+@pytest.mark.parametrize("filter", ["gaussian", "bilinear", "bicubic"])
+def test_downsampling_prox_l2(filter, device):
+    r"""
+    Tests that the closed-form proximal operator of the downsampling operator matches the conjugate gradient solution.
+
+    :param filter: (str) downsampling filter
+    :param device: (torch.device) cpu or cuda:x
+    """
+    torch.manual_seed(0)
+    img_size = (3, 32, 32)
+    physics = dinv.physics.Downsampling(
+        img_size=img_size,
+        factor=2,
+        filter=filter,
+        device=device,
+        max_iter=500,
+        tol=1e-5,
+    )
+
+    x = torch.randn((2,) + img_size, device=device)
+    z = torch.randn_like(x)
+    y = physics(x)
+
+    x_fft = physics.prox_l2(z, y, gamma=0.5)
+    x_cg = physics.prox_l2(z, y, gamma=0.5, use_fft=False)
+    assert torch.allclose(x_fft, x_cg, atol=1e-4)
+
+
 def test_reset_noise(device):
     r"""
     Tests that the reset function works.